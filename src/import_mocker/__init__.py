@@ -7,10 +7,52 @@ way. The mocking of the dependencies will apply only to the current import and
 will not affect the global module namespace.
 """
 
+import builtins
+import contextlib
+import functools
 import importlib
+import re
 import sys
-from typing import List
-from unittest import mock
+import types
+from typing import Iterable, List
+
+
+@functools.lru_cache(maxsize=None)
+def _mock_class():
+    """
+    Imports `unittest.mock` on first use and returns the `Mock` class.
+    Deferring the import keeps `import import_mocker` itself cheap, since
+    `unittest.mock` pulls in a sizeable dependency tree.
+    """
+    from unittest import mock
+
+    return mock.Mock
+
+
+class _StubModule(object):
+    """
+    A lightweight stand-in for a mocked module. Attribute access lazily
+    creates and caches child stubs, and calling a stub returns the stub
+    itself. Unlike `mock.Mock`, no call history is recorded, which makes
+    both creation and every call considerably cheaper, and `__slots__`
+    keeps the per-stub footprint to a single child dict instead of a full
+    instance `__dict__`.
+    """
+
+    __slots__ = ("_children",)
+
+    def __init__(self):
+        self._children = {}
+
+    def __getattr__(self, name):
+        children = self._children
+        value = children.get(name)
+        if value is None:
+            value = children[name] = _StubModule()
+        return value
+
+    def __call__(self, *args, **kwargs):
+        return self
 
 
 class ImportMocker(object):
@@ -21,10 +63,44 @@ class ImportMocker(object):
     interfere global module namespace.
     """
 
-    def __init__(self, modules_to_mock: List[str]):
-        self._modules_to_mock = modules_to_mock
-        self._mocks = {}
+    def __init__(
+        self,
+        modules_to_mock: Iterable[str],
+        stub_only: bool = False,
+        mock_prefixes: Iterable[str] = (),
+    ):
+        """
+        Creates an `ImportMocker` that will mock every module in
+        `modules_to_mock`. When `stub_only` is `True` the mocked modules are
+        lightweight stubs that do not record call history; use it when the
+        tests never call `assert_called_*` on the mocks and the overhead of
+        `mock.Mock` call tracking is unwanted. Every module whose name is, or
+        starts with a dotted prefix of, an entry in `mock_prefixes` is mocked
+        as well, so a whole package family can be mocked without listing each
+        submodule.
+        """
+        self._stub_only = stub_only
+        # Creating every mock upfront reduces the hook's mocked-module path
+        # to a single dict lookup: presence in `_mocks` means "mock it".
+        # Interning the keys lets that probe compare by pointer identity
+        # against the already-interned names the compiler passes to
+        # `__import__`.
+        self._mocks = {
+            sys.intern(name): self._make_mock() for name in modules_to_mock
+        }
+        # A single compiled alternation matches any family prefix in one pass
+        # over the name, instead of a per-prefix startswith scan per import.
+        mock_prefixes = tuple(mock_prefixes)
+        self._prefix_re = (
+            re.compile("|".join(re.escape(p) + r"(\.|$)" for p in mock_prefixes))
+            if mock_prefixes
+            else None
+        )
+        self._imported_cache = {}
+        self._code_cache = {}
+        self._resolved_cache = {}
         self._orig_import = __import__
+        self._import_mock = self._build_import_mock()
 
     def import_module(self, module_to_import: str):
         """
@@ -32,29 +108,43 @@ class ImportMocker(object):
         modules when they are imported, all other imports will work normally.
         If `module_to_import` was previously imported, then it's reloaded so
         that its imported modules can be mocked again.
+
+        Modules already imported by this instance are returned from a cache
+        without being reloaded, since reloading them with the same mocks would
+        produce an identical result. Call `invalidate_cache` to force the next
+        import to reload them.
         """
-        with mock.patch("builtins.__import__", side_effect=self._import_mock):
-            if module_to_import in sys.modules:
-                return importlib.reload(sys.modules[module_to_import])
-            else:
-                return importlib.import_module(module_to_import)
+        cached = self._imported_cache.get(module_to_import)
+        if cached is not None:
+            return cached
+
+        with self._mock_imports():
+            return self._import_or_reload(module_to_import)
+
+    def invalidate_cache(self):
+        """
+        Clears the cache of modules imported by this instance, so that the
+        next `import_module` call re-imports (and reloads) them. The cache of
+        modules resolved by the import hook is cleared as well.
+        """
+        self._imported_cache.clear()
+        self._resolved_cache.clear()
 
     def import_modules(self, modules_to_import: List[str]):
         """
         Uses the same logic of `import_module` but receives a list of module
         names to import and returns a list with the imported modules in the same
-        order.
+        order. The import hook is installed once around the whole batch rather
+        than once per module.
         """
-        imported_modules = []
-        for module in modules_to_import:
-            imported_modules.append(self.import_module(module))
-                    
-        return imported_modules
+        with self._mock_imports():
+            return [self._import_or_reload(module) for module in modules_to_import]
 
     def execute(self, function, *args, **kwargs):
         """
         Executes a function inside a context that returns the mocked modules
-        when they are imported, all other imports will work normally.
+        when they are imported, all other imports will work normally. Returns
+        whatever `function` returns.
 
         This is useful when you are testing code that has `import` statements
         inside a function, and you want to mock those imports.
@@ -63,14 +153,16 @@ class ImportMocker(object):
         instance of the `ImportMocker`, it will not be re imported when
         executing the function.
         """
-        with mock.patch("builtins.__import__", side_effect=self._import_mock):
-            function(*args, **kwargs)
+        with self._mock_imports():
+            return function(*args, **kwargs)
 
     def get_mocks(self):
         """
-        Gets a copy of the dictionary containing all the mocked modules.
+        Gets a read-only view of the dictionary containing all the mocked
+        modules. The view is cheap to create and always reflects the current
+        mocks; use `dict(imocker.get_mocks())` if a mutable copy is needed.
         """
-        return self._mocks.copy()
+        return types.MappingProxyType(self._mocks)
 
     def get_mock(self, mock_name: str):
         """
@@ -80,21 +172,152 @@ class ImportMocker(object):
 
     def reset_mocks(self):
         """
-        Resets all the mocked modules to their original state.
+        Resets all the mocked modules to their original state. This is a
+        no-op when `stub_only` is enabled, since stubs track no state.
         """
-        for _, mock_module in self._mocks.items():
-            mock_module.reset_mock()
+        if self._stub_only:
+            return
+        for mock_module in self._mocks.values():
+            # `mock_calls` covers calls to the mock and to all its children;
+            # when it is empty there is no tracked state to clear, so the
+            # recursive walk done by `reset_mock` can be skipped entirely.
+            if mock_module.mock_calls:
+                mock_module.reset_mock()
 
     def reset_mock(self, mock_name: str):
         """
-        Resets the specified mocked module to its original state.
+        Resets the specified mocked module to its original state. This is a
+        no-op when `stub_only` is enabled, since stubs track no state.
         """
+        if self._stub_only:
+            return
         self._mocks[mock_name].reset_mock()
 
-    def _import_mock(self, name, *args):
-        if name in self._modules_to_mock:
-            if name not in self._mocks:
-                self._mocks[name] = mock.Mock()
-            return self._mocks[name]
+    def _import_or_reload(self, module_to_import: str):
+        """
+        Performs the cached import (or reload) of a single module. Must be
+        called with the import hook installed.
+        """
+        cached = self._imported_cache.get(module_to_import)
+        if cached is not None:
+            return cached
+
+        module = sys.modules.get(module_to_import)
+        if module is not None:
+            code = self._code_cache.get(module_to_import)
+            if code is not None:
+                # Re-executing the cached code object has the same effect as
+                # `importlib.reload` but skips the finder/spec/loader phase.
+                exec(code, module.__dict__)
+            else:
+                module = importlib.reload(module)
+                self._cache_code(module_to_import, module)
+        else:
+            module = importlib.import_module(module_to_import)
+            self._cache_code(module_to_import, module)
+
+        self._imported_cache[module_to_import] = module
+        return module
+
+    def _cache_code(self, module_name: str, module):
+        """
+        Caches the module's compiled code object, when its loader exposes one,
+        so that later reloads can re-execute it directly.
+        """
+        spec = getattr(module, "__spec__", None)
+        loader = getattr(spec, "loader", None)
+        get_code = getattr(loader, "get_code", None)
+        if get_code is None:
+            return
+        try:
+            code = get_code(module_name)
+        except ImportError:
+            return
+        if code is not None:
+            self._code_cache[module_name] = code
+
+    @contextlib.contextmanager
+    def _mock_imports(self):
+        """
+        Replaces `builtins.__import__` with `_import_mock` for the duration of
+        the context. Assigning the function directly is much cheaper than
+        `mock.patch(..., side_effect=...)`, which routes every intercepted
+        import through `Mock.__call__` and its call-tracking machinery.
+
+        The previous value is restored on exit, whatever it was, so contexts
+        nest correctly (e.g. `import_module` called from within `execute`).
+        """
+        previous = builtins.__import__
+        builtins.__import__ = self._import_mock
+        try:
+            yield
+        finally:
+            builtins.__import__ = previous
+
+    def _make_mock(self):
+        """
+        Creates the mock for a single module.
+        """
+        return _StubModule() if self._stub_only else _mock_class()()
+
+    def _build_import_mock(self):
+        """
+        Builds the `__import__` replacement as a closure. Everything the hook
+        needs on every call is captured as a free variable, which is cheaper
+        to load than a `self` attribute on a path that runs once per
+        intercepted import.
+        """
+        orig_import = self._orig_import
+        sys_modules = sys.modules
+        mocks = self._mocks
+        mocks_get = mocks.get
+        make_mock = self._make_mock
+        prefix_match = self._prefix_re.match if self._prefix_re else None
+        sys_modules_get = sys_modules.get
+        resolved = self._resolved_cache
+        resolved_get = resolved.get
+
+        # The signature mirrors `builtins.__import__` so callers' positional
+        # arguments bind directly to locals instead of being packed into a
+        # `*args` tuple on every intercepted import.
+        def _import_mock(name, globals=None, locals=None, fromlist=(), level=0):
+            mocked = mocks_get(name)
+            if mocked is not None:
+                return mocked
+
+            if prefix_match is not None and prefix_match(name) is not None:
+                mocked = mocks[name] = make_mock()
+                return mocked
+
+            # Fast path: absolute imports of modules that are already loaded
+            # can be answered straight from `sys.modules`, without re-entering
+            # the full import machinery. With an empty `fromlist`, `__import__`
+            # returns the top-level package of `name`.
+            if not fromlist and not level:
+                module = sys_modules_get(name)
+                if module is not None:
+                    if "." not in name:
+                        return module
+                    # The top-level package may have been removed from
+                    # `sys.modules` even though the submodule entry is still
+                    # there; fall through so it gets re-imported like the real
+                    # `__import__` would.
+                    module = sys_modules_get(name.partition(".")[0])
+                    if module is not None:
+                        return module
+
+            if level:
+                # Relative imports depend on the calling package; never cached.
+                return orig_import(name, globals, locals, fromlist, level)
+
+            # Cache resolved absolute imports so repeats (in particular
+            # `from X import y` forms, which the fast path above cannot serve)
+            # skip the import machinery entirely.
+            key = (name, tuple(fromlist)) if fromlist else name
+            module = resolved_get(key)
+            if module is None:
+                module = orig_import(name, globals, locals, fromlist, level)
+                resolved[key] = module
+            return module
 
-        return self._orig_import(name, *args)
+        return _import_mock
@@ -17,6 +17,6 @@ def function_a_that_imports_and_calls_d():
     import module_d
     module_d.function_d()
 
-def function_a_that_imports_and_calls_e_(x,y,z):
+def function_a_that_imports_and_calls_e(x, y, z):
     import module_e
     module_e.function_e(x+y+z)
\ No newline at end of file
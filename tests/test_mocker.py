@@ -1,6 +1,8 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+import sys
+
 from unittest import mock
 from import_mocker import ImportMocker
 
@@ -130,8 +132,8 @@ def test_can_execute_code_on_dynamically_imported_mock():
     # Act
     module_a.function_a_that_calls_b()
     module_a.function_a_that_calls_c()
-    imocker.execute(lambda: module_a.function_a_that_imports_and_calls_d())
-    imocker.execute(lambda: module_a.function_a_that_imports_and_calls_e(1, 2, z=3))
+    imocker.execute(module_a.function_a_that_imports_and_calls_d)
+    imocker.execute(module_a.function_a_that_imports_and_calls_e, 1, 2, z=3)
 
     # Assert
     # Verify mocks are executed correctly
@@ -148,3 +150,122 @@ def test_can_execute_code_on_dynamically_imported_mock():
     # The module_e mock should have been imported dynamically when using execute()
     module_e = imocker.get_mock("module_e")
     module_e.function_e.assert_called_once_with(1+2+3)
+
+def test_can_mock_single_module_with_stub_only():
+    # Arrange
+    imocker = ImportMocker(["module_b"], stub_only=True)
+    module_a = imocker.import_module("module_a")
+
+    # Act
+    module_a.function_a_that_calls_b()
+
+    # Assert
+    # Stub mocks are plain objects without Mock's call tracking
+    module_b = imocker.get_mock("module_b")
+    assert not isinstance(module_b, mock.Mock)
+
+    # Resetting stubs is a no-op and must not raise
+    imocker.reset_mock("module_b")
+    imocker.reset_mocks()
+
+def test_import_module_caches_same_instance_imports():
+    # Arrange
+    imocker = ImportMocker(["module_b"])
+
+    # Act
+    first = imocker.import_module("module_a")
+    second = imocker.import_module("module_a")
+    imocker.invalidate_cache()
+    third = imocker.import_module("module_a")
+
+    # Assert
+    # The same module object is returned, cached or reloaded
+    assert first is second
+    assert first is third
+
+def test_execute_returns_function_result():
+    # Arrange
+    imocker = ImportMocker([])
+
+    # Act
+    result = imocker.execute(lambda x, y: x + y, 1, 2)
+
+    # Assert
+    assert result == 3
+
+def test_can_mock_module_families_with_prefixes():
+    # Arrange
+    imocker = ImportMocker([], mock_prefixes=["module_f"])
+
+    def function_that_imports_family():
+        import module_f
+        module_f.function_f()
+        import module_f.submodule
+
+    # Act
+    imocker.execute(function_that_imports_family)
+
+    # Assert
+    # Every module under the prefix is mocked, without being listed explicitly
+    mocked_modules = imocker.get_mocks()
+    assert isinstance(mocked_modules["module_f"], mock.Mock)
+    assert isinstance(mocked_modules["module_f.submodule"], mock.Mock)
+    mocked_modules["module_f"].function_f.assert_called_once()
+
+def test_can_import_module_while_executing():
+    # Arrange
+    imocker = ImportMocker(["module_b", "module_d"])
+
+    def function_that_imports_while_executing():
+        imocker.import_module("module_a")
+        import module_d
+        module_d.function_d()
+
+    # Act
+    imocker.execute(function_that_imports_while_executing)
+
+    # Assert
+    # Imports performed after the nested import_module must still be mocked
+    module_d = imocker.get_mock("module_d")
+    module_d.function_d.assert_called_once()
+
+
+def test_execute_can_import_submodules_of_loaded_packages():
+    # Arrange
+    import logging.handlers
+    imocker = ImportMocker([])
+
+    def function_that_imports_submodule():
+        import logging.handlers
+        return logging
+
+    # Act
+    result = imocker.execute(function_that_imports_submodule)
+
+    # Assert
+    # With an empty fromlist the import returns the top-level package
+    assert result is sys.modules["logging"]
+
+
+def test_execute_reimports_top_level_package_removed_from_sys_modules():
+    # Arrange
+    import logging.handlers
+    imocker = ImportMocker([])
+
+    def function_that_imports_submodule():
+        import logging.handlers
+        return logging
+
+    # Act
+    # Remove the top-level package while its submodule entry remains, as test
+    # suites that manipulate sys.modules do; the import must not crash
+    saved = sys.modules.pop("logging")
+    try:
+        result = imocker.execute(function_that_imports_submodule)
+    finally:
+        sys.modules["logging"] = saved
+
+    # Assert
+    # The top-level package was re-imported instead of raising a KeyError
+    assert result.__name__ == "logging"
+    assert result is not saved